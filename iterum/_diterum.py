@@ -67,6 +67,9 @@ class Diterum(Iterum[T_co]):
         """
         ...
 
+    def __length_hint__(self) -> int:
+        return self.len()
+
     # Defined by Iterator
     def rev(self) -> Rev[T_co]:
         """
@@ -347,3 +350,80 @@ class diterum(Diterum[T_co]):
             return 0
 
         return self._back + 1 - self._front
+
+    def count(self) -> int:
+        """
+        Consumes the sequence, returning the number of remaining elements
+        without stepping through them.
+
+        Examples:
+
+            >>> itr = diterum([1, 2, 3])
+            >>> assert itr.count() == 3
+            >>> assert itr.next() == nil
+        """
+
+        count = self.len()
+        self._front = self._back + 1
+        return count
+
+    def last(self) -> Option[T_co]:
+        """
+        Consumes the sequence, returning the last element by indexing
+        directly into it.
+
+        Examples:
+
+            >>> itr = diterum([1, 2, 3])
+            >>> assert itr.last() == Some(3)
+            >>> assert itr.next() == nil
+        """
+
+        if self._back < self._front:
+            return nil
+
+        last = self._seq[self._back]
+        self._front = self._back + 1
+        return Some(last)
+
+    def nth(self, n: int, /) -> Option[T_co]:
+        """
+        Returns the nth element of the sequence by indexing directly into it,
+        discarding the preceding elements.
+
+        Examples:
+
+            >>> itr = diterum([1, 2, 3])
+            >>> assert itr.nth(1) == Some(2)
+            >>> assert itr.nth(1) == nil
+        """
+
+        if n < 0:
+            return nil
+        if n >= self.len():
+            self._front = self._back + 1
+            return nil
+
+        self._front += n
+        return self.next()
+
+    def nth_back(self, n: int, /) -> Option[T_co]:
+        """
+        Returns the nth element from the end of the sequence by indexing
+        directly into it, discarding the elements after it.
+
+        Examples:
+
+            >>> itr = diterum([1, 2, 3])
+            >>> assert itr.nth_back(1) == Some(2)
+            >>> assert itr.nth_back(1) == nil
+        """
+
+        if n < 0:
+            return nil
+        if n >= self.len():
+            self._back = self._front - 1
+            return nil
+
+        self._back -= n
+        return self.next_back()
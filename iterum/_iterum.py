@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import builtins
+import functools
 import itertools
+import math
+import operator
 from abc import abstractmethod
+from collections import deque
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
@@ -193,26 +197,17 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2]).cmp([1]) == Ordering.Greater
             >>> assert iterum([1]).cmp([1, 2]) == Ordering.Less
         """
-        other = iterum(other)
-        while True:
-            match self.next(), other.next():
-                case Some(left), Some(right):
-                    if left > right:  # type: ignore | reason: ask for forgiveness not permission
-                        return Ordering.Greater
-                    if left < right:  # type: ignore | reason: ask for forgiveness not permission
-                        return Ordering.Less
-                    continue
-                case Some(), Nil():
-                    return Ordering.Greater
+        for left, right in itertools.zip_longest(self, other, fillvalue=NotSet):
+            if left is NotSet:
+                return Ordering.Less
+            if right is NotSet:
+                return Ordering.Greater
+            if left > right:  # type: ignore | reason: ask for forgiveness not permission
+                return Ordering.Greater
+            if left < right:  # type: ignore | reason: ask for forgiveness not permission
+                return Ordering.Less
 
-                case Nil(), Some():
-                    return Ordering.Less
-
-                case Nil(), Nil():
-                    return Ordering.Equal
-
-                case _:
-                    raise AssertionError("Unreachable!")
+        return Ordering.Equal
 
     @overload
     def collect(self: Iterum[T_co], /) -> list[T_co]:
@@ -255,6 +250,12 @@ class Iterum(Iterator[T_co]):
 
             using `join` to collect an iterable of `str`
             >>> assert iterum("test").map(str.upper).collect("".join) == "TEST"
+
+            using a typed `array` for compact numeric storage
+            >>> from array import array
+            >>> from functools import partial
+            >>> halves = iterum([1, 2, 3]).map(lambda x: x / 2).collect(partial(array, "d"))
+            >>> assert halves == array("d", [0.5, 1.0, 1.5])
         """
         return container(self)
 
@@ -272,8 +273,9 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2, 3]).count() == 3
             >>> assert iterum([1, 2, 3, 4, 5]).count() == 5
         """
-        last = self.enumerate().last()
-        return last.map_or(0, lambda last: last[0] + 1)
+        counter = itertools.count()
+        deque(zip(self, counter), maxlen=0)
+        return next(counter)
 
     def cycle(self: Iterum[T_co], /) -> Cycle[T_co]:
         """
@@ -338,8 +340,13 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1]).eq([1])
             >>> assert not iterum([1]).eq([1, 2])
         """
-        cmp = self.cmp(other)  # type: ignore | reason: ask for forgiveness not permission
-        return cmp == Ordering.Equal
+        for left, right in itertools.zip_longest(self, other, fillvalue=NotSet):
+            if left is NotSet or right is NotSet:
+                return False
+            if left != right:
+                return False
+
+        return True
 
     def filter(
         self: Iterum[T_co], predicate: Callable[[T_co], object], /
@@ -421,10 +428,7 @@ class Iterum(Iterator[T_co]):
 
         Note that `it.find(f)` is equivalent to `it.filter(f).next()`.
         """
-        for x in self:
-            if predicate(x):
-                return Some(x)
-        return nil
+        return _try_next(builtins.filter(predicate, self))
 
     def find_map(self, predicate: Callable[[T_co], Option[U]], /) -> Option[U]:
         """
@@ -530,10 +534,7 @@ class Iterum(Iterator[T_co]):
 
             ```
         """
-        acc = init
-        for x in self:
-            acc = f(acc, x)
-        return acc
+        return functools.reduce(f, self, init)
 
     def for_each(self, f: Callable[[T_co], object], /) -> None:
         """
@@ -547,8 +548,7 @@ class Iterum(Iterator[T_co]):
             >>> seq(5).map(lambda x: x * 2 + 1).for_each(v.append)
             >>> assert v == [1, 3, 5, 7, 9]
         """
-        for x in self:
-            f(x)
+        deque(builtins.map(f, self), maxlen=0)
 
     def fuse(self) -> Fuse[T_co]:
         """
@@ -608,7 +608,7 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2]).ge([1, 2])
         """
         cmp = self.cmp(other)  # type: ignore | reason: ask for forgiveness not permission
-        return cmp in (Ordering.Greater, Ordering.Equal)
+        return cmp is not Ordering.Less
 
     @overload
     def gt(self: Iterum[SupportsRichComparison], other: Iterable[object], /) -> bool:
@@ -635,7 +635,7 @@ class Iterum(Iterator[T_co]):
             >>> assert not iterum([1, 2]).gt([1, 2])
         """
         cmp = self.cmp(other)  # type: ignore | reason: ask for forgiveness not permission
-        return cmp == Ordering.Greater
+        return cmp is Ordering.Greater
 
     def inspect(self, f: Callable[[T_co], object], /) -> Inspect[T_co]:
         """
@@ -693,11 +693,8 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2, 3]).last() == Some(3)
             >>> assert iterum([1, 2, 3, 4, 5]).last() == Some(5)
         """
-        last = nil
-        while (nxt := self.next()) is not nil:
-            last = nxt
-
-        return last
+        last = deque(self, maxlen=1)
+        return Some(last[0]) if last else nil
 
     @overload
     def le(self: Iterum[SupportsRichComparison], other: Iterable[object], /) -> bool:
@@ -724,7 +721,7 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2]).le([1, 2])
         """
         cmp = self.cmp(other)  # type: ignore | reason: ask for forgiveness not permission
-        return cmp in (Ordering.Less, Ordering.Equal)
+        return cmp is not Ordering.Greater
 
     @overload
     def lt(self: Iterum[SupportsRichComparison], other: Iterable[object], /) -> bool:
@@ -751,7 +748,7 @@ class Iterum(Iterator[T_co]):
             >>> assert not iterum([1, 2]).lt([1, 2])
         """
         cmp = self.cmp(other)  # type: ignore | reason: ask for forgiveness not permission
-        return cmp == Ordering.Less
+        return cmp is Ordering.Less
 
     def map(self, f: Callable[[T_co], U], /) -> Map[U]:
         """
@@ -820,10 +817,8 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2, 3]).max() == Some(3)
             >>> assert iterum([]).max() == nil
         """
-        try:
-            return Some(builtins.max(self))
-        except ValueError:
-            return nil
+        max_ = builtins.max(self, default=NotSet)
+        return Some(max_) if NotSetType.is_set(max_) else nil
 
     def max_by(self, compare: Callable[[T_co, T_co], Ordering], /) -> Option[T_co]:
         """
@@ -864,13 +859,8 @@ class Iterum(Iterator[T_co]):
             >>> a = [-3, 0, 1, 5, -10]
             >>> assert iterum(a).max_by_key(abs).unwrap() == -10
         """
-
-        def compare(x, y) -> Ordering:
-            fx = f(x)
-            fy = f(y)
-            return Ordering.cmp(fx, fy)
-
-        return self.max_by(compare)
+        max_ = builtins.max(self, key=f, default=NotSet)
+        return Some(max_) if NotSetType.is_set(max_) else nil
 
     def min(
         self: Iterum[SupportsRichComparisonT],
@@ -886,10 +876,8 @@ class Iterum(Iterator[T_co]):
             >>> assert iterum([1, 2, 3]).min() == Some(1)
             >>> assert iterum([]).min() == nil
         """
-        try:
-            return Some(builtins.min(self))
-        except ValueError:
-            return nil
+        min_ = builtins.min(self, default=NotSet)
+        return Some(min_) if NotSetType.is_set(min_) else nil
 
     def min_by(self, compare: Callable[[T_co, T_co], Ordering], /) -> Option[T_co]:
         """
@@ -930,13 +918,8 @@ class Iterum(Iterator[T_co]):
             >>> a = [-3, 0, 1, 5, -10]
             >>> assert iterum(a).min_by_key(abs).unwrap() == 0
         """
-
-        def compare(x, y) -> Ordering:
-            fx = f(x)
-            fy = f(y)
-            return Ordering.cmp(fx, fy)
-
-        return self.min_by(compare)
+        min_ = builtins.min(self, key=f, default=NotSet)
+        return Some(min_) if NotSetType.is_set(min_) else nil
 
     @overload
     def ne(self: Iterum[SupportsRichComparison], other: Iterable[object], /) -> bool:
@@ -991,12 +974,10 @@ class Iterum(Iterator[T_co]):
             >>> itr = iterum([1, 2, 3])
             >>> assert itr.nth(3) == nil
         """
-        for i, x in enumerate(self):
-            if i > n:
-                return nil
-            if i == n:
-                return Some(x)
-        return nil
+        if n < 0:
+            return nil
+
+        return _try_next(itertools.islice(self, n, n + 1))
 
     @overload
     def partial_cmp(
@@ -1101,8 +1082,12 @@ class Iterum(Iterator[T_co]):
             >>> assert odd == [1, 3]
         """
         matches, notmatches = [], []
+        matches_append, notmatches_append = matches.append, notmatches.append
         for x in self:
-            matches.append(x) if f(x) else notmatches.append(x)
+            if f(x):
+                matches_append(x)
+            else:
+                notmatches_append(x)
 
         return container(matches), container(notmatches)
 
@@ -1160,10 +1145,9 @@ class Iterum(Iterator[T_co]):
             >>> assert it.next() == Some(3)
             >>> assert it.position(lambda x: x == 4) == Some(0)
         """
-        for i, x in enumerate(self):
-            if predicate(x):
-                return Some(i)
-        return nil
+        return _try_next(
+            itertools.compress(itertools.count(), builtins.map(predicate, self))
+        )
 
     def product(self: Iterum[SupportsMulT]) -> Option[SupportsMulT]:
         """
@@ -1180,7 +1164,11 @@ class Iterum(Iterator[T_co]):
             >>> assert factorial(1) == 1
             >>> assert factorial(5) == 120
         """
-        return self.reduce(lambda acc, x: acc * x)
+        first = self.next()
+        if first is nil:
+            return nil
+
+        return Some(math.prod(self, start=first.unwrap()))
 
     def reduce(self, f: Callable[[T_co, T_co], T_co], /) -> Option[T_co]:
         """
@@ -1203,8 +1191,8 @@ class Iterum(Iterator[T_co]):
         first = self.next()
         if first is nil:
             return nil
-        else:
-            return Some(self.fold(first.unwrap(), f))
+
+        return Some(functools.reduce(f, self, first.unwrap()))
 
     def scan(self, init: U, f: Callable[[State[U], T_co], Option[V]], /) -> Scan[V]:
         """
@@ -1495,8 +1483,13 @@ class Iterum(Iterator[T_co]):
             >>> assert left == [1, 3, 5]
             >>> assert right == [2, 4, 6]
         """
-        left, right = map(container, zip(*self))
-        return left, right
+        left, right = [], []
+        left_append, right_append = left.append, right.append
+        for x, y in self:
+            left_append(x)
+            right_append(y)
+
+        return container(left), container(right)
 
     def zip(self, other: Iterable[U], /) -> Zip[T_co, U]:
         """
@@ -1549,13 +1542,16 @@ class Iterum(Iterator[T_co]):
         return Zip(self, other)
 
 
+# reads Some's payload in C; only ever applied to values already known to be Some
+_unwrap_some = operator.attrgetter("_value")
+
+
 def _try_next(itr: Iterator[T], /) -> Option[T]:
-    try:
-        nxt = next(itr)
-    except StopIteration:
+    nxt = next(itr, NotSet)
+    if nxt is NotSet:
         return nil
-    else:
-        return Some(nxt)
+
+    return Some(nxt)  # type: ignore | reason: NotSet is ruled out by the identity check
 
 
 class _IterumAdapter(Iterum[T_co]):
@@ -1565,6 +1561,12 @@ class _IterumAdapter(Iterum[T_co]):
     def next(self) -> Option[T_co]:
         return _try_next(self._iter)
 
+    def __next__(self) -> T_co:
+        return next(self._iter)
+
+    def __length_hint__(self) -> int:
+        return operator.length_hint(self._iter)
+
 
 class Chain(_IterumAdapter[T_co]):
     __slots__ = ("_iter",)
@@ -1602,53 +1604,35 @@ class FlatMap(_IterumAdapter[T_co]):
     def __init__(
         self, __iterable: Iterable[U], f: Callable[[U], Iterable[T_co]], /
     ) -> None:
-        self._iter = iterum(__iterable).map(f).flatten()
+        self._iter = itertools.chain.from_iterable(builtins.map(f, __iterable))
 
 
-class FilterMap(Iterum[T_co]):
-    __slots__ = ("_iter", "_predicate")
+class FilterMap(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(
         self, __iterable: Iterable[U], predicate: Callable[[U], Option[T_co]], /
     ) -> None:
-        self._iter = iterum(__iterable)
-        self._predicate = predicate
-
-    def next(self) -> Option[T_co]:
-        while True:
-            x = self._iter.next()
-            if x.is_nil():
-                return nil
-
-            r = self._predicate(x.unwrap())
-            if r.is_some():
-                return r
+        self._iter = builtins.map(
+            _unwrap_some,
+            builtins.filter(None, builtins.map(predicate, __iterable)),
+        )
 
 
 class Flatten(_IterumAdapter[T_co]):
     __slots__ = ("_iter",)
 
     def __init__(self, __iterable: Iterable[Iterable[T_co]], /) -> None:
-        self._iter = iter(y for x in __iterable for y in x)
+        self._iter = itertools.chain.from_iterable(__iterable)
 
 
-class Fuse(Iterum[T_co]):
-    __slots__ = ("_iter", "_fuse")
+class Fuse(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(self, __iterable: Iterable[T_co]) -> None:
-        self._iter = iterum(__iterable)
-        self._fuse = True
-
-    def next(self) -> Option[T_co]:
-        if not self._fuse:
-            return nil
-
-        nxt = self._iter.next()
-        if nxt.is_nil():
-            self._fuse = False
-            return nil
-
-        return nxt
+        # chain releases each iterable as soon as it is exhausted, so the
+        # source is never polled again after its first StopIteration
+        self._iter = itertools.chain(__iterable)
 
 
 class Inspect(Iterum[T_co]):
@@ -1657,69 +1641,68 @@ class Inspect(Iterum[T_co]):
     def __init__(
         self, __iterable: Iterable[T_co], f: Callable[[T_co], object], /
     ) -> None:
-        self._iter = iterum(__iterable)
+        self._iter = iter(__iterable)
         self._f = f
 
     def next(self) -> Option[T_co]:
-        nxt = self._iter.next()
-        nxt.map(self._f)
+        nxt = next(self._iter, NotSet)
+        if nxt is NotSet:
+            return nil
+
+        self._f(nxt)  # type: ignore | reason: NotSet is ruled out by the identity check
+        return Some(nxt)  # type: ignore | reason: NotSet is ruled out by the identity check
+
+    def __next__(self) -> T_co:
+        nxt = next(self._iter)
+        self._f(nxt)
         return nxt
 
 
-class Map(Iterum[T_co]):
-    __slots__ = ("_iter", "_f")
+class Map(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(self, __iterable: Iterable[U], f: Callable[[U], T_co], /) -> None:
-        self._iter = iterum(__iterable)
-        self._f = f
-
-    def next(self) -> Option[T_co]:
-        return self._iter.next().map(self._f)
+        self._iter = builtins.map(f, __iterable)
 
 
-class MapWhile(Iterum[T_co]):
-    __slots__ = ("_iter", "_predicate", "_fuse")
+class MapWhile(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(
         self, __iterable: Iterable[U], predicate: Callable[[U], Option[T_co]], /
     ) -> None:
-        self._iter = iterum(__iterable)
-        self._predicate = predicate
-        self._fuse = True
-
-    def next(self) -> Option[T_co]:
-        if not self._fuse:
-            return nil
-
-        r = self._iter.next().map(self._predicate).flatten()
-        if r.is_nil():
-            self._fuse = False
-
-        return r
+        somes = itertools.takewhile(bool, builtins.map(predicate, __iterable))
+        self._iter = builtins.map(_unwrap_some, somes)
 
 
 class Peekable(Iterum[T_co]):
     __slots__ = ("_iter", "_peek")
 
     def __init__(self, __iterable: Iterable[T_co], /) -> None:
-        self._iter = iterum(__iterable)
+        self._iter = iter(__iterable)
         self._peek: Option[T_co] | NotSetType = NotSet
 
     def next(self) -> Option[T_co]:
-        if isinstance(self._peek, NotSetType):
-            return self._iter.next()
-        elif self._peek is nil:
-            return nil
-        else:
-            nxt, self._peek = self._peek, NotSet
-            return nxt
+        nxt = self._peek
+        if nxt is NotSet:
+            return _try_next(self._iter)
+        elif nxt is not nil:
+            self._peek = NotSet
+
+        return nxt  # type: ignore | reason: NotSet is ruled out by the identity check
+
+    def __next__(self) -> T_co:
+        if self._peek is NotSet:
+            return next(self._iter)
+
+        return super().__next__()
 
     @property
     def peek(self) -> Option[T_co]:
-        if isinstance(self._peek, NotSetType):
-            self._peek = self.next()
+        if self._peek is NotSet:
+            self._peek = _try_next(self._iter)
 
-        return self._peek
+        return self._peek  # type: ignore | reason: NotSet is ruled out by the identity check
 
     @peek.setter
     def peek(self, value: T_co) -> None:  # type: ignore | reason: still need to constrain input param type
@@ -1729,7 +1712,7 @@ class Peekable(Iterum[T_co]):
         self._peek = Some(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class State(Generic[T]):
     """
     Simple class which holds some mutable state.
@@ -1751,16 +1734,20 @@ class Scan(Iterum[T_co]):
         f: Callable[[State[V], U], Option[T_co]],
         /,
     ):
-        self._iter = iterum(__iterable)
+        self._iter = iter(__iterable)
         self._state = State(init)
         self._f = f
 
     def next(self) -> Option[T_co]:
-        return self._iter.next().map(lambda val: self._f(self._state, val)).flatten()
+        nxt = next(self._iter, NotSet)
+        if nxt is NotSet:
+            return nil
+
+        return self._f(self._state, nxt)  # type: ignore | reason: NotSet is ruled out by the identity check
 
 
-class Skip(Iterum[T_co]):
-    __slots__ = ("_iter", "_n")
+class Skip(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(
         self,
@@ -1768,19 +1755,13 @@ class Skip(Iterum[T_co]):
         n: int,
         /,
     ) -> None:
-        self._iter = iterum(__iterable)
-        self._n = n
+        # islice is lazy: the first n elements are only dropped on the first pull;
+        # a negative count skips nothing
+        self._iter = itertools.islice(__iterable, max(n, 0), None)
 
-    def next(self) -> Option[T_co]:
-        if self._n:
-            self._iter.nth(self._n - 1)
-            self._n = 0
-
-        return self._iter.next()
 
-
-class SkipWhile(Iterum[T_co]):
-    __slots__ = ("_iter", "_predicate", "_fuse")
+class SkipWhile(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(
         self,
@@ -1788,70 +1769,34 @@ class SkipWhile(Iterum[T_co]):
         predicate: Callable[[T_co], object],
         /,
     ) -> None:
-        self._iter = iterum(__iterable)
-        self._predicate = predicate
-        self._fuse = True
+        self._iter = itertools.dropwhile(predicate, __iterable)
 
-    def next(self) -> Option[T_co]:
-        if not self._fuse:
-            return self._iter.next()
-
-        nxt = nil
-        while self._fuse:
-            nxt = self._iter.next()
-            self._fuse = nxt.is_some_and(self._predicate)
 
-        return nxt
-
-
-class StepBy(Iterum[T_co]):
-    __slots__ = ("_iter", "_step")
+class StepBy(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(self, __iterable: Iterable[T_co], step: int, /) -> None:
         if step <= 0:
             raise ValueError(f"Step must be positive, provided: {step}")
 
-        self._iter = iterum(__iterable).enumerate()
-        self._step = step
-
-    def next(self) -> Option[T_co]:
-        idx, nxt = self._iter.next().unzip()
-        while nxt.is_some() and idx.is_some_and(lambda idx: idx % self._step):
-            idx, nxt = self._iter.next().unzip()
-
-        return nxt
+        self._iter = itertools.islice(__iterable, 0, None, step)
 
 
-class Take(Iterum[T_co]):
-    __slots__ = ("_iter", "_max", "_idx")
+class Take(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(self, __iterable: Iterable[T_co], n: int, /) -> None:
-        self._iter = iterum(__iterable)
-        self._max = n
-        self._idx = 0
+        # a negative count takes nothing, as it did before the islice rewrite
+        self._iter = itertools.islice(__iterable, max(n, 0))
 
-    def next(self) -> Option[T_co]:
-        if self._idx >= self._max:
-            return nil
 
-        self._idx += 1
-        return self._iter.next()
-
-
-class TakeWhile(Iterum[T_co]):
-    __slots__ = ("_iter", "_predicate")
+class TakeWhile(_IterumAdapter[T_co]):
+    __slots__ = ("_iter",)
 
     def __init__(
         self, __iterable: Iterable[T_co], predicate: Callable[[T_co], object], /
     ) -> None:
-        self._iter = iterum(__iterable)
-        self._predicate = predicate
-
-    def next(self) -> Option[T_co]:
-        nxt = self._iter.next()
-        if nxt.is_some_and(self._predicate):
-            return nxt
-        return nil
+        self._iter = itertools.takewhile(predicate, __iterable)
 
 
 class Zip(_IterumAdapter[tuple[U, V]]):
@@ -1903,6 +1848,12 @@ class iterum(Iterum[T_co]):
         """
         return _try_next(self._iter)
 
+    def __next__(self) -> T_co:
+        return next(self._iter)
+
+    def __length_hint__(self) -> int:
+        return operator.length_hint(self._iter)
+
 
 def seq(*args, **kwargs):
     """
@@ -639,11 +639,14 @@ class Some(Generic[T]):
     """
 
     __match_args__ = ("_value",)
+    __slots__ = ("_value",)
 
     def __init__(self, value: T, /) -> None:
         self._value = value
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Some):
             return NotImplemented
         return self._value == other._value
@@ -727,7 +730,7 @@ class Some(Generic[T]):
             >>> assert Some(3).filter(lambda x: x % 2 == 0) == nil
             >>> assert Some(4).filter(lambda x: x % 2 == 0) == Some(4)
         """
-        return self if predicate(self._value) else Nil()
+        return self if predicate(self._value) else nil
 
     def flatten(self: Some[O]) -> O:
         """Converts from `Option[Option[T]]` to `Option[T]`.
@@ -3,8 +3,6 @@ from __future__ import annotations
 from enum import Enum
 from enum import unique
 
-from ._singleton import create_singleton
-
 
 @unique
 class Ordering(Enum):
@@ -13,17 +11,17 @@ class Ordering(Enum):
     two values.
     """
 
-    Less = create_singleton("Less")
+    Less = -1
     """
     An ordering where a compared value is less than another.
     """
 
-    Equal = create_singleton("Equal")
+    Equal = 0
     """
     An ordering where a compared value is equal to another.
     """
 
-    Greater = create_singleton("Greater")
+    Greater = 1
     """
     An ordering where a compared value is greater than another.
     """
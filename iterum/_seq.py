@@ -148,6 +148,14 @@ class Seq(Diterum[int]):
         self._front += self._step
         return nxt
 
+    def __next__(self) -> int:
+        front = self._front
+        if self._dir * (self._back - front) < 0:
+            raise StopIteration
+
+        self._front = front + self._step
+        return front
+
     def next_back(self) -> Option[int]:
         if self._dir * (self._back - self._front) < 0:
             return nil
@@ -162,6 +170,45 @@ class Seq(Diterum[int]):
 
         return (self._back + self._step - self._front) // self._step
 
+    def count(self) -> int:
+        count = self.len()
+        if count:
+            # an already empty seq keeps its cursors, like next() does
+            self._front = self._back + self._step
+        return count
+
+    def last(self) -> Option[int]:
+        if self._dir * (self._back - self._front) < 0:
+            return nil
+
+        last = Some(self._back)
+        self._front = self._back + self._step
+        return last
+
+    def nth(self, n: int, /) -> Option[int]:
+        if n < 0:
+            return nil
+        length = self.len()
+        if n >= length:
+            if length:
+                self._front = self._back + self._step
+            return nil
+
+        self._front += n * self._step
+        return self.next()
+
+    def nth_back(self, n: int, /) -> Option[int]:
+        if n < 0:
+            return nil
+        length = self.len()
+        if n >= length:
+            if length:
+                self._back = self._front - self._step
+            return nil
+
+        self._back -= n * self._step
+        return self.next_back()
+
     def __repr__(self) -> str:
         return (
             f"{type(self).__name__}("
@@ -196,6 +243,11 @@ class InfSeq(Iterum[int]):
         self._front += self._step
         return nxt
 
+    def __next__(self) -> int:
+        front = self._front
+        self._front = front + self._step
+        return front
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}(start={self._front}, step={self._step})"
 
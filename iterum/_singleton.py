@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import Any
 from typing import TypeVar
 
 
@@ -8,13 +9,9 @@ Self = TypeVar("Self", bound="Singleton")
 
 class Singleton:
     __slots__ = ()
-    __instance = None
+    __instance: Any = None
 
     def __new__(cls: type[Self]) -> Self:
         if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
+            cls.__instance = object.__new__(cls)
         return cls.__instance
-
-
-def create_singleton(name: str) -> object:
-    return type(name, (Singleton,), {})()
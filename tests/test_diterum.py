@@ -1,3 +1,5 @@
+import operator
+
 from iterum import diterum
 from iterum import nil
 from iterum import Some
@@ -112,3 +114,43 @@ def test_len_basic_usage():
 
     assert di.next() == nil
     assert di.len() == 0
+
+
+def test_count_consumes():
+    di = diterum([1, 2, 3, 4])
+
+    assert di.next() == Some(1)
+    assert di.count() == 3
+    assert di.next() == nil
+    assert di.next_back() == nil
+
+
+def test_last_consumes():
+    di = diterum([1, 2, 3])
+
+    assert di.last() == Some(3)
+    assert di.last() == nil
+    assert di.next_back() == nil
+
+
+def test_nth_past_end():
+    di = diterum([1, 2, 3])
+
+    assert di.nth(1) == Some(2)
+    assert di.nth(5) == nil
+    assert di.len() == 0
+    assert di.next_back() == nil
+
+
+def test_nth_negative_is_nil():
+    di = diterum([1, 2, 3])
+
+    assert di.nth(-1) == nil
+    assert di.next() == Some(1)
+
+
+def test_length_hint_is_len():
+    di = diterum([1, 2, 3])
+
+    assert di.next_back() == Some(3)
+    assert operator.length_hint(di) == di.len() == 2
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import operator
 from functools import partial
 from typing import Iterator
+from unittest.mock import ANY
 
 import pytest
 
@@ -14,16 +16,18 @@ from iterum import Some
 from iterum import State
 
 
-def test_all_basic_usage():
-    a = [1, 2, 3]
+@pytest.fixture(scope="module")
+def one_two_three() -> tuple[int, ...]:
+    return (1, 2, 3)
 
-    assert iterum(a).all(lambda x: x > 0)
-    assert not iterum(a).all(lambda x: x > 2)
 
+def test_all_basic_usage(one_two_three):
+    assert iterum(one_two_three).all(lambda x: x > 0)
+    assert not iterum(one_two_three).all(lambda x: x > 2)
 
-def test_all_stops_at_first_false():
-    a = [1, 2, 3]
-    itr = iterum(a)
+
+def test_all_stops_at_first_false(one_two_three):
+    itr = iterum(one_two_three)
 
     assert not itr.all(lambda x: x != 2)
 
@@ -31,16 +35,13 @@ def test_all_stops_at_first_false():
     assert itr.next() == Some(3)
 
 
-def test_any_basic_usage():
-    a = [1, 2, 3]
-
-    assert iterum(a).any(lambda x: x > 0)
-    assert not iterum(a).any(lambda x: x > 5)
+def test_any_basic_usage(one_two_three):
+    assert iterum(one_two_three).any(lambda x: x > 0)
+    assert not iterum(one_two_three).any(lambda x: x > 5)
 
 
-def test_any_stops_at_first_false():
-    a = [1, 2, 3]
-    itr = iterum(a)
+def test_any_stops_at_first_false(one_two_three):
+    itr = iterum(one_two_three)
 
     assert itr.any(lambda x: x != 2)
 
@@ -63,22 +64,78 @@ def test_chain_basic_usage():
     assert itr.next() == nil
 
 
-def test_cmp_basic_usage():
-    assert iterum([1]).cmp([1]) == Ordering.Equal
-    assert iterum([1, 2]).cmp([1]) == Ordering.Greater
-    assert iterum([1]).cmp([1, 2]) == Ordering.Less
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        ([1], [1], Ordering.Equal),
+        ([1, 2], [1], Ordering.Greater),
+        ([1], [1, 2], Ordering.Less),
+        ([2], [1], Ordering.Greater),
+        ([1], [2], Ordering.Less),
+        ([2], [1, 3], Ordering.Greater),
+        ([1, 3], [2], Ordering.Less),
+    ],
+)
+def test_cmp_basic_usage(left, right, expected):
+    assert iterum(left).cmp(right) == expected
+
+
+@pytest.mark.parametrize(
+    ("op", "left", "right", "expected"),
+    [
+        ("eq", [1], [1], True),
+        ("eq", [1], [1, 2], False),
+        ("ne", [1], [1], False),
+        ("ne", [1], [1, 2], True),
+        ("ge", [1], [1], True),
+        ("ge", [1], [1, 2], False),
+        ("ge", [1, 2], [1], True),
+        ("ge", [1, 2], [1, 2], True),
+        ("gt", [1], [1], False),
+        ("gt", [1], [1, 2], False),
+        ("gt", [1, 2], [1], True),
+        ("gt", [1, 2], [1, 2], False),
+        ("le", [1], [1], True),
+        ("le", [1], [1, 2], True),
+        ("le", [1, 2], [1], False),
+        ("le", [1, 2], [1, 2], True),
+        ("lt", [1], [1], False),
+        ("lt", [1], [1, 2], True),
+        ("lt", [1, 2], [1], False),
+        ("lt", [1, 2], [1, 2], False),
+    ],
+)
+def test_comparison_basic_usage(op, left, right, expected):
+    assert getattr(iterum(left), op)(right) is expected
+
+
+def test_eq_only_needs_equality():
+    assert iterum([{"a": 1}]).eq([{"a": 1}])
+    assert iterum([{"a": 1}]).ne([{"a": 2}])
+
+
+def test_eq_length_mismatch_with_always_equal_element():
+    assert not iterum([1, ANY]).eq([1])
+    assert not iterum([1]).eq([1, ANY])
+    assert iterum([1, ANY]).eq([1, 2])
+
+
+def test_eq_stops_at_first_difference():
+    itr = iterum([1, 2, 3, 4])
+
+    assert not itr.eq([1, 3, 3, 4])
+    assert itr.next() == Some(3)
 
 
-def test_cmp_some_more():
-    assert iterum([2]).cmp([1]) == Ordering.Greater
-    assert iterum([1]).cmp([2]) == Ordering.Less
+def test_cmp_stops_at_first_difference():
+    itr = iterum([1, 2, 3, 4])
 
-    assert iterum([2]).cmp([1, 3]) == Ordering.Greater
-    assert iterum([1, 3]).cmp([2]) == Ordering.Less
+    assert itr.cmp([1, 3, 0]) == Ordering.Less
+    assert itr.next() == Some(3)
 
 
-def test_collect_basic_usage():
-    doubled = iterum([1, 2, 3]).map(lambda x: x * 2).collect(list)
+def test_collect_basic_usage(one_two_three):
+    doubled = iterum(one_two_three).map(lambda x: x * 2).collect(list)
     assert doubled == [2, 4, 6]
 
 
@@ -86,14 +143,45 @@ def test_collect_string():
     assert iterum("test").map(str.upper).collect("".join) == "TEST"
 
 
-def test_count_basic_usage():
-    assert iterum([1, 2, 3]).count() == 3
+def test_collect_through_stacked_adapters(one_two_three):
+    itr = iterum(one_two_three).map(lambda x: x * 2).filter(lambda x: x > 2)
+
+    assert list(itr) == [4, 6]
+    assert itr.next() == nil
+
+
+def test_iter_returns_self(one_two_three):
+    itr = iterum(one_two_three)
+    assert iter(itr) is itr
+
+    mapped = itr.map(str)
+    assert iter(mapped) is mapped
+
+
+def test_for_loop_shares_progress(one_two_three):
+    itr = iterum(one_two_three).map(lambda x: x * 2)
+    for x in itr:
+        assert x == 2
+        break
+
+    assert itr.next() == Some(4)
+
+
+def test_collect_length_hint(one_two_three):
+    itr = iterum(one_two_three)
+
+    assert operator.length_hint(itr) == 3
+    assert itr.next() == Some(1)
+    assert operator.length_hint(itr) == 2
+
+
+def test_count_basic_usage(one_two_three):
+    assert iterum(one_two_three).count() == 3
     assert iterum([1, 2, 3, 4, 5]).count() == 5
 
 
-def test_cycle_basic_usage():
-    a = [1, 2, 3]
-    it = iterum(a).cycle()
+def test_cycle_basic_usage(one_two_three):
+    it = iterum(one_two_three).cycle()
 
     assert it.next() == Some(1)
     assert it.next() == Some(2)
@@ -115,11 +203,6 @@ def test_enumerate_basic_usage():
     assert it.next() == nil
 
 
-def test_eq_basic_usage():
-    assert iterum([1]).eq([1])
-    assert not iterum([1]).eq([1, 2])
-
-
 def test_filter_basic_usage():
     a = [0, 1, 2]
 
@@ -149,15 +232,13 @@ def test_filter_map_basic_usage():
     assert it.next() == nil
 
 
-def test_find_basic_usage():
-    a = [1, 2, 3]
+def test_find_basic_usage(one_two_three):
+    assert iterum(one_two_three).find(lambda x: x == 2) == Some(2)
+    assert iterum(one_two_three).find(lambda x: x == 5) == nil
 
-    assert iterum(a).find(lambda x: x == 2) == Some(2)
-    assert iterum(a).find(lambda x: x == 5) == nil
 
-
-def test_find_stops_at_first_true():
-    it = iterum([1, 2, 3])
+def test_find_stops_at_first_true(one_two_three):
+    it = iterum(one_two_three)
 
     assert it.find(lambda x: x == 2) == Some(2)
 
@@ -193,9 +274,8 @@ def test_flatten_mapping_and_then_flattening():
     assert merged == "alphabetagamma"
 
 
-def test_fold_basic_usage():
-    a = [1, 2, 3]
-    sum = iterum(a).fold(0, lambda acc, x: acc + x)
+def test_fold_basic_usage(one_two_three):
+    sum = iterum(one_two_three).fold(0, lambda acc, x: acc + x)
     assert sum == 6
 
 
@@ -237,28 +317,14 @@ def test_fuse_not_so_basic_usage():
     assert list(it) == [16, 17, 18, 19]
     assert list(it) == []
     assert list(it) == []
+    assert it.next() == nil
 
 
-def test_ge_basic_usage():
-    assert iterum([1]).ge([1])
-    assert not iterum([1]).ge([1, 2])
-    assert iterum([1, 2]).ge([1])
-    assert iterum([1, 2]).ge([1, 2])
-
-
-def test_gt_basic_usage():
-    assert not iterum([1]).gt([1])
-    assert not iterum([1]).gt([1, 2])
-    assert iterum([1, 2]).gt([1])
-    assert not iterum([1, 2]).gt([1, 2])
-
-
-def test_inspect_basic_usage():
-    a = [1, 2, 3]
+def test_inspect_basic_usage(one_two_three):
     b = []
 
     c = (
-        iterum(a)
+        iterum(one_two_three)
         .map(lambda x: x * 2)
         .inspect(b.append)
         .take_while(lambda x: x < 5)
@@ -269,28 +335,13 @@ def test_inspect_basic_usage():
     assert c == [2, 4]
 
 
-def test_last_basic_usage():
-    assert iterum([1, 2, 3]).last() == Some(3)
+def test_last_basic_usage(one_two_three):
+    assert iterum(one_two_three).last() == Some(3)
     assert iterum([1, 2, 3, 4, 5]).last() == Some(5)
 
 
-def test_le_basic_usage():
-    assert iterum([1]).le([1])
-    assert iterum([1]).le([1, 2])
-    assert not iterum([1, 2]).le([1])
-    assert iterum([1, 2]).le([1, 2])
-
-
-def test_lt_basic_usage():
-    assert not iterum([1]).lt([1])
-    assert iterum([1]).lt([1, 2])
-    assert not iterum([1, 2]).lt([1])
-    assert not iterum([1, 2]).lt([1, 2])
-
-
-def test_map_basic_usage():
-    a = [1, 2, 3]
-    itr = iterum(a).map(lambda x: x * 2)
+def test_map_basic_usage(one_two_three):
+    itr = iterum(one_two_three).map(lambda x: x * 2)
 
     assert itr.next() == Some(2)
     assert itr.next() == Some(4)
@@ -325,14 +376,21 @@ def test_map_while_stop_after_first_nil():
     assert it.next() == nil
 
 
-def test_max_basic_usage():
-    a = [1, 2, 3]
+def test_max_basic_usage(one_two_three):
     b = []
 
-    assert iterum(a).max() == Some(3)
+    assert iterum(one_two_three).max() == Some(3)
     assert iterum(b).max() == nil
 
 
+def test_max_does_not_swallow_value_error():
+    def raises(x: int) -> int:
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        iterum([1, 2]).map(raises).max()
+
+
 def test_max_by_basic_usage():
     a = [-3, 0, 1, 5, -10]
 
@@ -345,11 +403,27 @@ def test_max_by_key_basic_usage():
     assert iterum(a).max_by_key(abs).unwrap() == -10
 
 
-def test_min_basic_usage():
-    a = [1, 2, 3]
+def test_by_key_calls_key_once_per_element():
+    a = [-3, 0, 1, 5, -10]
+    seen = []
+
+    def key(x: int) -> int:
+        seen.append(x)
+        return abs(x)
+
+    assert iterum(a).max_by_key(key) == Some(-10)
+    assert seen == a
+
+    seen.clear()
+    assert iterum(a).min_by_key(key) == Some(0)
+    assert seen == a
+    assert iterum([]).min_by_key(key) == nil
+
+
+def test_min_basic_usage(one_two_three):
     b = []
 
-    assert iterum(a).min() == Some(1)
+    assert iterum(one_two_three).min() == Some(1)
     assert iterum(b).min() == nil
 
 
@@ -371,46 +445,48 @@ def test_min_by_key_ensure_map_is_not_returned():
     assert iterum(a).min_by_key(lambda x: -x).unwrap() == 5
 
 
-def test_ne_basic_usage():
-    assert not iterum([1]).ne([1])
-    assert iterum([1]).ne([1, 2])
-
-
-def test_nth_basic_usage():
-    a = [1, 2, 3]
+def test_nth_basic_usage(one_two_three):
+    assert iterum(one_two_three).nth(1) == Some(2)
 
-    assert iterum(a).nth(1) == Some(2)
 
-
-def test_nth_no_rewind():
-    itr = iterum([1, 2, 3])
+def test_nth_no_rewind(one_two_three):
+    itr = iterum(one_two_three)
 
     assert itr.nth(1) == Some(2)
     assert itr.nth(1) == nil
 
 
-def test_nth_nil_if_past():
-    itr = iterum([1, 2, 3])
+def test_nth_nil_if_past(one_two_three):
+    itr = iterum(one_two_three)
 
     assert itr.nth(3) == nil
 
 
-def test_partial_cmp_basic_usage():
-    assert iterum([1]).partial_cmp([1]) == Some(Ordering.Equal)
-    assert iterum([1, 2]).partial_cmp([1]) == Some(Ordering.Greater)
-    assert iterum([1]).partial_cmp([1, 2]) == Some(Ordering.Less)
+def test_nth_negative_is_nil(one_two_three):
+    itr = iterum(one_two_three)
 
+    assert itr.nth(-1) == nil
+    assert itr.next() == Some(1)
 
-def test_partial_cmp_results_determined_by_order():
-    assert iterum([1, None]).partial_cmp([2, nil]) == Some(Ordering.Less)
-    assert iterum([2, None]).partial_cmp([1, nil]) == Some(Ordering.Greater)
-    assert iterum([None, 1]).partial_cmp([2, None]) == nil
 
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        ([1], [1], Some(Ordering.Equal)),
+        ([1, 2], [1], Some(Ordering.Greater)),
+        ([1], [1, 2], Some(Ordering.Less)),
+        ([1, None], [2, nil], Some(Ordering.Less)),
+        ([2, None], [1, nil], Some(Ordering.Greater)),
+        ([None, 1], [2, None], nil),
+        ([None], [None], nil),
+    ],
+)
+def test_partial_cmp_basic_usage(left, right, expected):
+    assert iterum(left).partial_cmp(right) == expected
 
-def test_partition_basic_usage():
-    a = [1, 2, 3]
 
-    even, odd = iterum(a).partition(lambda n: n % 2 == 0)
+def test_partition_basic_usage(one_two_three):
+    even, odd = iterum(one_two_three).partition(lambda n: n % 2 == 0)
 
     assert even == [2]
     assert odd == [1, 3]
@@ -450,15 +526,15 @@ def test_peekable_setter():
     assert list(itr) == [1000, 3]
 
 
-def test_peekable_setting_peek_before_checking_it_is_okay():
-    itr = iterum([1, 2, 3]).peekable()
+def test_peekable_setting_peek_before_checking_it_is_okay(one_two_three):
+    itr = iterum(one_two_three).peekable()
     itr.peek = 1000
 
     assert list(itr) == [1000, 2, 3]
 
 
-def test_peekable_setting_peek_past_end_raises():
-    itr = iterum([1, 2, 3]).peekable()
+def test_peekable_setting_peek_past_end_raises(one_two_three):
+    itr = iterum(one_two_three).peekable()
     list(itr)
 
     with pytest.raises(IndexError) as ex:
@@ -476,11 +552,39 @@ def test_peekable_peek_then_iter():
     assert list(itr) == [1, 2, 3]
 
 
-def test_position_basic_usage():
-    a = [1, 2, 3]
+def test_peekable_peek_inside_loop():
+    itr = iterum([1, 2, 3, 4]).peekable()
+
+    seen = []
+    for x in itr:
+        seen.append(x)
+        itr.peek
+
+    assert seen == [1, 2, 3, 4]
+    assert itr.peek == nil
+
+
+def test_peekable_peek_after_map():
+    itr = iterum([1, 2, 3]).peekable()
+    mapped = itr.map(str)
+
+    assert itr.peek == Some(1)
+    assert mapped.collect() == ["1", "2", "3"]
+
 
-    assert iterum(a).position(lambda x: x == 2) == Some(1)
-    assert iterum(a).position(lambda x: x == 5) == nil
+def test_peekable_repeated_peek_pulls_once():
+    pulled = []
+    itr = iterum([1, 2]).inspect(pulled.append).peekable()
+
+    assert itr.peek is itr.peek
+    assert pulled == [1]
+    assert itr.next() == Some(1)
+    assert pulled == [1]
+
+
+def test_position_basic_usage(one_two_three):
+    assert iterum(one_two_three).position(lambda x: x == 2) == Some(1)
+    assert iterum(one_two_three).position(lambda x: x == 5) == nil
 
 
 def test_position_stop_after_the_first_true():
@@ -521,20 +625,35 @@ def test_scan_not_so_basic_usage():
     assert scan.next() == nil
 
 
-def test_skip_basic_usage():
-    itr = iterum([1, 2, 3]).skip(2)
+def test_skip_basic_usage(one_two_three):
+    itr = iterum(one_two_three).skip(2)
 
     assert itr.next() == Some(3)
     assert itr.next() == nil
 
 
-def test_skip_past_end():
-    itr = iterum([1, 2, 3]).skip(10)
+def test_skip_past_end(one_two_three):
+    itr = iterum(one_two_three).skip(10)
 
     assert itr.next() == nil
     assert itr.next() == nil
 
 
+def test_skip_negative_skips_nothing(one_two_three):
+    itr = iterum(one_two_three).skip(-1)
+
+    assert itr.collect() == [1, 2, 3]
+
+
+def test_skip_is_lazy():
+    pulled = []
+    itr = iterum([1, 2, 3]).inspect(pulled.append).skip(1)
+
+    assert pulled == []
+    assert list(itr) == [2, 3]
+    assert pulled == [1, 2, 3]
+
+
 def test_skip_while_basic_usage():
     itr = iterum([-1, 0, 1]).skip_while(lambda x: x < 0)
 
@@ -561,25 +680,37 @@ def test_step_by_basic_usage():
     assert itr.next() == nil
 
 
-def test_sum_basic_usage():
-    a = [1, 2, 3]
-    sum_ = iterum(a).sum().unwrap()
+def test_step_by_only_pulls_what_it_needs():
+    itr = iterum([0, 1, 2, 3, 4, 5])
+    step = itr.step_by(3)
+
+    assert step.next() == Some(0)
+    assert itr.next() == Some(1)
+    assert step.next() == Some(4)
+    assert itr.next() == Some(5)
+
+
+def test_step_by_rejects_non_positive(one_two_three):
+    with pytest.raises(ValueError):
+        iterum(one_two_three).step_by(0)
+
+
+def test_sum_basic_usage(one_two_three):
+    sum_ = iterum(one_two_three).sum().unwrap()
 
     assert sum_ == 6
 
 
-def test_take_basic_usage():
-    a = [1, 2, 3]
-    itr = iterum(a).take(2)
+def test_take_basic_usage(one_two_three):
+    itr = iterum(one_two_three).take(2)
 
     assert itr.next() == Some(1)
     assert itr.next() == Some(2)
     assert itr.next() == nil
 
 
-def test_take_basic_usage2():
-    a = [1, 2, 3]
-    itr = iterum(a).take(2)
+def test_take_basic_usage2(one_two_three):
+    itr = iterum(one_two_three).take(2)
 
     assert list(itr) == [1, 2]
     assert itr.next() == nil
@@ -602,6 +733,20 @@ def test_take_more_than_you_have():
     assert itr.next() == nil
 
 
+def test_take_does_not_pull_past_n(one_two_three):
+    itr = iterum(one_two_three)
+
+    assert itr.take(2).collect() == [1, 2]
+    assert itr.next() == Some(3)
+
+
+def test_take_negative_is_empty(one_two_three):
+    itr = iterum(one_two_three)
+
+    assert itr.take(-1).next() == nil
+    assert itr.next() == Some(1)
+
+
 def test_take_while_basic_usage():
     a = [-1, 0, 1]
     itr = iterum(a).take_while(lambda x: x < 0)
@@ -616,6 +761,8 @@ def test_take_while_stop_after_first_false():
 
     assert itr.next() == Some(-1)
     assert itr.next() == nil
+    assert itr.next() == nil
+    assert itr.next() == nil
 
 
 def checked_add_i8(lhs: int, rhs: int) -> int:
@@ -626,10 +773,8 @@ def checked_add_i8(lhs: int, rhs: int) -> int:
         raise ValueError("Overflow!")
 
 
-def test_try_fold_basic_usage():
-    a = [1, 2, 3]
-
-    sum = iterum(a).try_fold(0, checked_add_i8)
+def test_try_fold_basic_usage(one_two_three):
+    sum = iterum(one_two_three).try_fold(0, checked_add_i8)
 
     assert sum == Some(6)
 
@@ -643,6 +788,16 @@ def test_try_fold_short_circuiting():
     assert list(it) == [40, 50]
 
 
+def test_try_fold_only_catches_from_closure(one_two_three):
+    def raises(x: int) -> int:
+        raise ValueError(x)
+
+    it = iterum(one_two_three).map(raises)
+
+    with pytest.raises(ValueError):
+        it.try_fold(0, checked_add_i8)
+
+
 def test_unzip_basic_usage():
     a = [(1, 2), (3, 4), (5, 6)]
 
@@ -652,6 +807,13 @@ def test_unzip_basic_usage():
     assert right == [2, 4, 6]
 
 
+def test_unzip_empty():
+    left, right = iterum([]).unzip()
+
+    assert left == []
+    assert right == []
+
+
 @pytest.mark.xfail(reason="Just not cool enough...")
 def test_unzip_multiple():
     a = [(1, (2, 3)), (4, (5, 6))]
@@ -674,7 +836,7 @@ def test_zip_basic_usage():
 
 
 def test_zip_against_larger():
-    cf_itr = seq(...)
+    cf_itr = seq(1 << 10)
     foo_itr = iterum("foo")
     zip_itr = foo_itr.zip(cf_itr)
 
@@ -689,7 +851,7 @@ def test_zip_against_larger():
 
 
 def test_zip_against_smaller():
-    cf_itr = seq(...)
+    cf_itr = seq(1 << 10)
     foo_itr = iterum("foo")
     zip_itr = cf_itr.zip(foo_itr)
 
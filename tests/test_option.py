@@ -14,6 +14,15 @@ def test_eq():
     assert Some(3) != Some(5)
 
 
+def test_some_is_not_shared():
+    x = Some(1)
+    y = Some(1)
+    x.insert(2)
+
+    assert x is not y
+    assert y == Some(1)
+
+
 def test_repr():
     assert repr(Some("test")) == f"{Some.__name__}({repr('test')})"
 
@@ -111,6 +111,18 @@ def test_seq_backwards_back_and_forth_len():
     assert itr.len() == 0
 
 
+def test_seq_iter_matches_range():
+    assert list(seq(1, 10, 3)) == list(range(1, 10, 3))
+    assert list(seq(0, -7, -2)) == list(range(0, -7, -2))
+    assert list(seq(5, 5)) == []
+
+    itr = seq(5)
+    assert next(itr) == 0
+    assert itr.next_back() == Some(4)
+    assert list(itr) == [1, 2, 3]
+    assert itr.next() == nil
+
+
 def test_seq_eq():
     assert seq(1, 10, 5) == seq(1, 10, 5)
     assert seq(1, 10, 5) == seq(1, 11, 5)  # will still end with same value
@@ -160,6 +172,13 @@ def test_infseq_backwards_next():
         assert itr.next() == Some(i)
 
 
+def test_infseq_iter():
+    itr = seq(2, ..., 3)
+
+    assert [next(itr) for _ in range(3)] == [2, 5, 8]
+    assert itr.next() == Some(11)
+
+
 def test_infseq_eq():
     assert seq(1, ..., 5) == seq(1, ..., 5)
     assert seq(1, ..., 5) != seq(0, ..., 5)
@@ -183,3 +202,63 @@ def test_infseq_repr():
 )
 def test_compute_back(start, end, step, expected):
     assert _compute_back(start, end, step) == expected
+
+
+@pytest.mark.parametrize("args", [(3,), (5, 0)])
+def test_seq_nth_past_end_matches_exhausted(args):
+    itr = seq(*args)
+    assert itr.nth(10) == nil
+
+    exhausted = seq(*args)
+    while exhausted.next() != nil:
+        pass
+
+    assert itr == exhausted
+    assert repr(itr) == repr(exhausted)
+    assert itr.len() == 0
+
+
+def test_seq_count_leaves_empty_seq_untouched():
+    itr = seq(5, 0)
+    assert itr.count() == 0
+    assert itr == seq(5, 0)
+    assert repr(itr) == repr(seq(5, 0))
+
+
+@pytest.mark.parametrize("args", [(3,), (5, 0)])
+def test_seq_nth_back_past_end_matches_exhausted(args):
+    itr = seq(*args)
+    assert itr.nth_back(10) == nil
+
+    exhausted = seq(*args)
+    while exhausted.next_back() != nil:
+        pass
+
+    assert itr == exhausted
+    assert repr(itr) == repr(exhausted)
+    assert itr.len() == 0
+
+
+def test_seq_nth_back_leaves_empty_seq_untouched():
+    itr = seq(5, 0)
+    assert itr.nth_back(0) == nil
+    assert itr == seq(5, 0)
+    assert repr(itr) == repr(seq(5, 0))
+
+
+def test_seq_count_last_nth():
+    assert seq(1, 15, 5).count() == 3
+    assert seq(0, -3, -1).last() == Some(-2)
+    assert seq(3).last() == Some(2)
+    assert seq(0).last() == nil
+
+    itr = seq(1, 15, 5)
+    assert itr.nth(1) == Some(6)
+    assert itr.nth(0) == Some(11)
+    assert itr.nth(0) == nil
+    assert itr.len() == 0
+
+    itr = seq(1, 15, 5)
+    assert itr.nth_back(1) == Some(6)
+    assert itr.nth_back(5) == nil
+    assert itr.next() == nil
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import assert_type
 from typing import Generic
 from typing import Iterable
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from iterum import Chain
@@ -52,7 +53,8 @@ def create_tuple_str_int() -> tuple[str, int]:
     ...
 
 
-itr = iterum([1, 2, 3])
+if TYPE_CHECKING:
+    itr = iterum([1, 2, 3])
 
 
 def iter_init():
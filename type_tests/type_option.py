@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 from typing import assert_type
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from .option_helpers import create_nil
@@ -27,7 +28,8 @@ U = TypeVar("U")
 V = TypeVar("V")
 
 
-option = create_option()
+if TYPE_CHECKING:
+    option = create_option()
 
 
 def isinstance_nil_implies_nil_else_some():
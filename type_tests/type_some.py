@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import assert_type
 from typing import Literal
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from .option_helpers import create_nil
@@ -26,7 +27,8 @@ U = TypeVar("U")
 V = TypeVar("V")
 
 
-some = Some(0)
+if TYPE_CHECKING:
+    some = Some(0)
 
 
 def some_also():